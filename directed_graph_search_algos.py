@@ -1,8 +1,10 @@
 # Author: Nicholas Bowden
-# Description: Contains DFS/BFS/Dijkstra's search methods for Directed Graph as well as: add_vertex(), add_edge()remove_edge(), get_vertices(), 
+# Description: Contains DFS/BFS/Dijkstra's search methods for Directed Graph as well as: add_vertex(), add_edge()remove_edge(), get_vertices(),
 #  get_edges()is_valid_path(), dfs(), ​bfs()has_cycle(), dijkstra(). More can be found on the docstring of each method and examples can be found in the included pdf.
 
+from array import array
 from collections import deque
+from itertools import repeat
 import heapq
 
 
@@ -15,12 +17,26 @@ class DirectedGraph:
     - vertex names are integers
     """
 
+    # Largest edge weight for which dijkstra() uses Dial's bucket queue
+    # instead of a binary heap; buckets cost O(max_dist + E) total, so they
+    # only pay off while the weight range stays small
+    _BUCKET_WEIGHT_CUTOFF = 64
+
     def __init__(self, start_edges=None):
         """
-        Store graph info as adjacency matrix
+        Store graph info in CSR (compressed sparse row) form.
+
+        Edge mutations are staged into a dict-of-dicts (_adj) and flattened
+        lazily into the three CSR arrays (_indptr, _indices, _weights) the
+        first time a traversal or query needs them.
         """
         self.v_count = 0
-        self.adj_matrix = []
+        self._adj = {}  # staged edges: src -> {dst: weight}
+        self._dirty = True
+        self._indptr = array('i', [0])
+        self._indices = array('i')
+        self._weights = array('i')
+        self._max_weight = 0
 
         # populate graph with initial vertices and edges (if provided)
         if start_edges is not None:
@@ -38,11 +54,12 @@ class DirectedGraph:
         """
         if self.v_count == 0:
             return 'EMPTY GRAPH\n'
+        matrix = self.adj_matrix
         out = '   |'
         out += ' '.join(['{:2}'.format(i) for i in range(self.v_count)]) + '\n'
         out += '-' * (self.v_count * 3 + 3) + '\n'
         for i in range(self.v_count):
-            row = self.adj_matrix[i]
+            row = matrix[i]
             out += '{:2} |'.format(i)
             out += ' '.join(['{:2}'.format(w) for w in row]) + '\n'
         out = f"GRAPH ({self.v_count} vertices):\n{out}"
@@ -50,60 +67,106 @@ class DirectedGraph:
 
     # ------------------------------------------------------------------ #
 
+    @property
+    def adj_matrix(self):
+        """
+        Dense adjacency matrix, materialized from the staged edges.
+
+        Only kept for display and legacy callers; the algorithms below all
+        read the CSR arrays instead.
+        """
+        matrix = [[0] * self.v_count for _ in range(self.v_count)]
+        for src, row in self._adj.items():
+            for dst, weight in row.items():
+                matrix[src][dst] = weight
+        return matrix
+
+    def _ensure_csr(self) -> None:
+        """
+        Flatten the staged edge dict into the CSR arrays if edges changed.
+
+        Destinations are emitted in ascending order per row so neighbor
+        scans visit vertices in the same order a dense row scan would.
+        """
+        if not self._dirty:
+            return
+        indptr = array('i', [0])
+        indices = array('i')
+        weights = array('i')
+        for src in range(self.v_count):
+            row = self._adj.get(src)
+            if row:
+                for dst in sorted(row):
+                    indices.append(dst)
+                    weights.append(row[dst])
+            indptr.append(len(indices))
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._max_weight = max(weights) if weights else 0
+        self._dirty = False
+
     def add_vertex(self) -> int:
         """
-        Adds a vertex to the graph. 
-        
-        Initializes a list with 0's to represent each of the existing vertices.
-        Loops through each list and adds a 0 to account for the newly added vertex.
-        Returns the current vertex count.
+        Adds a vertex to the graph. O(1).
+
+        New vertices start with no edges, so only the vertex count moves;
+        the CSR arrays pick up the extra (empty) row on the next rebuild.
+        Nothing is appended per existing vertex, so building a graph of V
+        vertices costs O(V) here rather than the O(V^2) row padding the
+        dense matrix needed. Returns the current vertex count.
         """
-        self.adj_matrix.append([0 for x in range(self.v_count)])
         self.v_count += 1
-
-        for row in self.adj_matrix:
-            row.append(0)
-        
+        self._dirty = True
         return self.v_count
-            
+
     def add_edge(self, src: int, dst: int, weight=1) -> None:
         """
         Create an edge between to vertices using source, destination, and weight.
 
         If any of the inputs are invalid, the edge is not added.
-        Otherwise, assigns the passed weight to the matrix.
+        Otherwise, stages the passed weight and marks the CSR arrays stale.
         """
-        # Invalid, src OR dst are out of range, 
+        # Invalid, src OR dst are out of range,
         if not 0 <= src < self.v_count or not 0 <= dst < self.v_count:
             return
-        
+
         # Invalid, src and dst are the same node
         if src == dst:
             return
-        
+
         # Invalid, negative weight
         if weight < 0:
             return
 
-        self.adj_matrix[src][dst] = weight
+        # Only invalidate the cached CSR arrays when an edge actually changes
+        row = self._adj.setdefault(src, {})
+        if weight == 0:  # weight 0 means no edge
+            if row.pop(dst, None) is not None:
+                self._dirty = True
+        elif row.get(dst) != weight:
+            row[dst] = weight
+            self._dirty = True
 
     def remove_edge(self, src: int, dst: int) -> None:
         """
         Removes an edge between two vertices using source, destination, and weight.
 
         If any of the inputs are invalid, an edge is not removed.
-        Otherwise resets the weight of that edge to 0.
+        Otherwise drops the staged edge and marks the CSR arrays stale.
         """
         # Invalid, src OR dst out of range
         if not 0 <= src < self.v_count or not 0 <= dst < self.v_count:
             return
-        
+
         # Invalid, src and dst are same vertex
         if src == dst:
-            return 
-
-        self.adj_matrix[src][dst] = 0
+            return
 
+        # Only invalidate the cached CSR arrays when an edge actually changes
+        row = self._adj.get(src)
+        if row and row.pop(dst, None) is not None:
+            self._dirty = True
 
     def get_vertices(self) -> []:
         """
@@ -117,16 +180,19 @@ class DirectedGraph:
         """
         Returns a list containing the current edges with their weights.
 
-        Loops through each cell in the matrix and if that cell is not 0, 
-        its location and value gets added to the result.
+        Single pass over the CSR arrays; only stored (non-zero) edges exist
+        there, so no per-cell weight check is needed. The (src, dst, weight)
+        tuples for each row are built in one zip/extend call instead of a
+        Python-level loop over every edge.
         """
+        self._ensure_csr()
+        indptr, indices, weights = self._indptr, self._indices, self._weights
         result = []
 
         for src in range(self.v_count):
-            for dst in range(self.v_count):
-                weight = self.adj_matrix[src][dst]
-                if weight != 0:
-                    result.append((src, dst, weight))
+            start, end = indptr[src], indptr[src + 1]
+            if start != end:
+                result.extend(zip(repeat(src), indices[start:end], weights[start:end]))
 
         return result
 
@@ -134,219 +200,257 @@ class DirectedGraph:
         """
         Returns True if the passed list contains a valid path, Otherwise returns False.
 
-        Loops through and checks if each vertex has a weighted edge to the next in the list.
-        If at any point there isn't an edge then it is an invalid path.
+        Validates every vertex id up front, then checks each consecutive
+        pair of vertices against the staged edge dict - one O(1) lookup per
+        step, returning on the first missing edge.
         """
-        size = len(path)
-        
-        # Empty Path
-        if size == 0:
-            return True
-
-        # Single vertex
-        if size == 1:
-            if path[0] < self.v_count:
-                return True
-            return False
+        # Empty path is valid, single vertex only needs to exist
+        if len(path) < 2:
+            return len(path) == 0 or 0 <= path[0] < self.v_count
 
-        src = path[0]
-        dst = path[1]
+        # Any out of range vertex invalidates the whole path
+        for vertex in path:
+            if not 0 <= vertex < self.v_count:
+                return False
 
-        # Returns false if there is ever a non weighted edge between two path vertices.
-        for i in range(2, size):
-            if self.adj_matrix[src][dst] == 0:
+        adj = self._adj
+        for src, dst in zip(path, path[1:]):
+            row = adj.get(src)
+            if not row or dst not in row:
                 return False
-            src = dst
-            dst = path[i]
-        
-        # Accounts for path size 2
-        if self.adj_matrix[src][dst] == 0:
-            return False
 
         return True
-            
+
     def dfs(self, v_start, v_end=None) -> []:
         """
-        Return list of vertices visited during this recursive DFS search. 
+        Return list of vertices visited during this DFS search.
 
         Can be used to find a specific node by using v_end, or find all connected nodes without.
-        Runs until all vertices are visited or v_end has been visited. 
-        Marks current node as visited, then loops through each column in the row list.
-        A recursive call is made at that vertex for each weighted edge in that list 
-        """
-        visited = []
-
-        if v_start not in self.get_vertices():
-            return visited
-
-        def rec_dfs(visited, v, v_end=None):
-            """Recursively checks for weighted edges to unvisited nodes."""
-            if v_end:
-                if v_end not in visited: # Runs until v_end is visited
-                    visited.append(v) 
-            elif v_end is None:  # Runs until all adjacent nodes are visited
-                visited.append(v)
-
-            # Loops through each adjacent vertex, recurring for each
-            for adj in range(len(self.adj_matrix[v])):
-                if v_end and v_end in visited:
+        Runs until all vertices are visited or v_end has been visited.
+
+        Runs an explicit stack of CSR-row iterators instead of recursion:
+        the top iterator is advanced to its next unseen neighbor, that
+        neighbor is visited and its own row iterator pushed; when a row is
+        exhausted the stack pops back to the previous vertex. No call frame
+        per vertex and no recursion-depth limit on deep graphs.
+
+        Visited flags live in a bytearray indexed by vertex id, so each
+        membership test is O(1); the visit order is kept in a separate list.
+        """
+        # Invalid starting node
+        if not 0 <= v_start < self.v_count:
+            return []
+
+        self._ensure_csr()
+        indptr, indices = self._indptr, self._indices
+
+        seen = bytearray(self.v_count)
+        seen[v_start] = 1
+        order = [v_start]
+        if v_start == v_end:
+            return order
+
+        stack = [iter(indices[indptr[v_start]:indptr[v_start + 1]])]
+        while stack:
+            # Advance the top iterator to its next unseen neighbor
+            for adj in stack[-1]:
+                if not seen[adj]:
+                    seen[adj] = 1
+                    order.append(adj)
+                    if adj == v_end:
+                        return order
+                    stack.append(iter(indices[indptr[adj]:indptr[adj + 1]]))
                     break
-                elif self.adj_matrix[v][adj] != 0 and adj not in visited:
-                    rec_dfs(visited, adj, v_end)
-                
-        rec_dfs(visited, v_start, v_end)
-      
-        return visited
+            else:  # Row exhausted, back up one vertex
+                stack.pop()
+
+        return order
 
     def bfs(self, v_start, v_end=None) -> []:
         """
         Return list of vertices visited during BFS search.
 
-        Uses a queue to keep track of unvisited vertices, runs until the queue is empty, indicating 
-        every connected node has been visited. 
         Can be used to search from node to node with the presence of v_end or to find all connected nodes without.
 
-        Takes the vertex at the front of the queue and gets it's adjacent matrix row list. Then
-        the vertex is added to the result list if its not a duplicate.
-        Loops through the row list, for each weighted edge found that vertex is added to the queue if it's not a duplicate.
-        Ends when v_end is added to the result list or when the queue is empty indicating that all of the connected
-        nodes have been visited.
+        The queue is a preallocated array('i') of v_count slots walked with
+        head/tail indices: vertices are marked seen as they are enqueued, so
+        each one enters the queue at most once, the buffer can never
+        overflow, and no per-node allocation happens during the traversal.
+        Ends when v_end leaves the queue or when the queue drains, indicating
+        that all of the connected nodes have been visited.
         """
-        visited = []
-        
         # Invalid starting node
-        if v_start not in self.get_vertices():
-            return visited
+        if not 0 <= v_start < self.v_count:
+            return []
 
-        next_vertex = deque()
-        next_vertex.append(v_start) 
+        self._ensure_csr()
+        indptr, indices = self._indptr, self._indices
 
-        # Runs until v_end is found or queue is empty
-        while len(next_vertex) != 0:
-            vertex = next_vertex.popleft()  # dequeue 
-            edges = self.adj_matrix[vertex]
+        seen = bytearray(self.v_count)
+        order = []
 
-            # Marks as visitied
-            if vertex not in visited:  
-                visited.append(vertex)
+        queue = array('i', [0]) * self.v_count
+        head = tail = 0
+        queue[tail] = v_start
+        tail += 1
+        seen[v_start] = 1
+
+        # Runs until v_end is found or queue is empty
+        while head < tail:
+            vertex = queue[head]  # dequeue
+            head += 1
+            order.append(vertex)
 
             # Ends loop
-            if vertex == v_end:  
-                return visited 
+            if vertex == v_end:
+                return order
 
-            for dst in range(len(edges)):
-                if self.adj_matrix[vertex][dst] != 0 and dst not in visited:  # Unvisited weighted edge
-                    next_vertex.append(dst)  # enqueue if not duplicate
-            
-        return visited  
+            for j in range(indptr[vertex], indptr[vertex + 1]):
+                dst = indices[j]
+                if not seen[dst]:  # Unvisited edge
+                    seen[dst] = 1
+                    queue[tail] = dst  # enqueue exactly once
+                    tail += 1
+
+        return order
 
     def has_cycle(self):
         """
-        Returns True if graph has a cycle and False if not using a recursive DFS method. 
-
-        Keeps a list of visited vertices and a stack to keep track of which path it is on
-        Iterates through each vertex in the graph, skipping the already visited and empty (no weighted edges) vertices.
-
-        When a weighted edge is found, marks current node as visited and also marks it on the path stack. 
-        Iterates through each weighted edge and making recursive calls for each. This if an adjacent node has 
-        already been marked in the path stack, if so then a cycle has been found. If not, then before each recursive call finishes
-        it unmarks the current node from the path stack and continues with the next node with path options. 
-        """
-        vertices = self.get_vertices()
-        visited = [False for i in range(len(vertices))]
-        path = [False for i in range(len(vertices))]  
-        cycle = False
-
-        def rec_dfs(visited, path, v):
-            """Recursively checks for a cycle"""
-            # Mark current node as visited
-            visited[v] = True
-            path[v] = True
-
-            # Adjacent vertices
-            for adj in range(len(self.adj_matrix[v])):
-                if self.adj_matrix[v][adj] != 0:
-                    if not visited[adj]:
-                        if rec_dfs(visited, path, adj): # Recur to check cycle
-                            return True 
-                    elif path[adj]:  # Base case, adjacent node already visited during this path. Cycle found
-                        return True
+        Returns True if graph has a cycle and False if not.
+
+        Iterative three-color DFS: every vertex is white (unvisited), gray
+        (on the current DFS path), or black (fully explored), packed one
+        byte each in a bytearray. The explicit stack holds (vertex,
+        row-iterator) pairs; finding a gray neighbor while advancing the
+        top iterator means a back edge, so a cycle. A vertex turns black
+        when its row is exhausted and it pops off the stack.
+        """
+        self._ensure_csr()
+        indptr, indices = self._indptr, self._indices
 
-            # Back track. Erases from list to check other options
-            path[v] = False
-            # No back edge
-            return False     
+        WHITE, GRAY, BLACK = 0, 1, 2
+        state = bytearray(self.v_count)
 
-        for vertex in vertices:
-            # Skips visited nodes, looking for unvisited chains
-            if visited[vertex]:
+        for start in range(self.v_count):
+            # Skips explored nodes, looking for unvisited chains
+            if state[start]:
                 continue
-            
-            # No weighted edges
-            empty = False
-            for i in range(len(self.adj_matrix[vertex])):
-                if empty:
-                    break
-                if self.adj_matrix[vertex][i] != 0:
-                    empty = True
 
-            # Returns True if cycle is found, continues otherwise
-            if rec_dfs(visited, path, vertex):
-                cycle = True
-                break 
+            state[start] = GRAY
+            stack = [(start, iter(indices[indptr[start]:indptr[start + 1]]))]
+            while stack:
+                vertex, row = stack[-1]
+
+                # Advance to this vertex's next relevant neighbor
+                for adj in row:
+                    if state[adj] == GRAY:  # Back edge onto the current path
+                        return True
+                    if state[adj] == WHITE:
+                        state[adj] = GRAY
+                        stack.append((adj, iter(indices[indptr[adj]:indptr[adj + 1]])))
+                        break
+                else:  # Row exhausted, vertex fully explored
+                    state[vertex] = BLACK
+                    stack.pop()
 
-        return cycle     
+        return False
 
     def dijkstra(self, src: int) -> []:
         """
         Finds the closes distance to each node in the list using dijkstra's algorithm.
 
-        Uses heapq to structure the priority queue for distance and node connections.
-        Creates a visited dictionary with the value of infinity set for each vertex.
-        
-        The source node is added to the priority queue with distance(priority) 0.
-        Iterates until the queue has been emptied, checking and updating the visited 
-        dictionary to only save the shortest distances to each vertex. Unpacks and returns
-        the visited values for the result.
-        """
-        # Initialize empty dictionary represented visited vertices
-        vertices = self.get_vertices()
-        visited = {vert: float('inf') for vert in vertices}
-
-        # Initialize priority queue and boilerplate methods from heapq documentation
-        pq = []  # heap
-        def add_task(task, priority=0):
-            """Add a new task or update the priority of an existing task"""
-            entry = [priority, task]
-            heapq.heappush(pq, entry)
-
-        def pop_task():
-            """Remove and return the lowest priority task. Raise KeyError if empty."""
-            while pq:
-                priority, task = heapq.heappop(pq)  
-                return task, priority
-            raise KeyError('pop from an empty priority queue')
-
-        # Add source vertex with distance(priority) 0
-        add_task(src, 0)
-        while len(pq) > 0:
-            try:
-                closest =  pop_task()
-            except(KeyError): 
-                break
-            vertex = closest[0]  # splits returned tuple
-            distance = closest[-1]
-            
-            # if current path distance is less than saved distance at this vertex
-            if int(distance) < visited[vertex]: 
-                visited[vertex] = distance  # updates distance(priority)
-                for c in range(len(self.adj_matrix[vertex])):
-
-                    # Found weighted edge for path
-                    if self.adj_matrix[vertex][c] != 0:
-                        add_task(c, distance + self.adj_matrix[vertex][c])
-            
-        return [*visited.values()]  # unpacks just the values
+        Keeps the best known distance to each vertex in a flat list, starting
+        at infinity, and returns that list. Dispatches on the largest stored
+        edge weight: small weights use Dial's bucket queue (O(1) amortized
+        per queue operation), anything larger falls back to the binary heap.
+        """
+        self._ensure_csr()
+        if 0 < self._max_weight <= self._BUCKET_WEIGHT_CUTOFF:
+            return self._dijkstra_buckets(src)
+        return self._dijkstra_heap(src)
+
+    def _dijkstra_heap(self, src: int) -> []:
+        """
+        Binary-heap Dijkstra over the CSR arrays.
+
+        The source vertex enters the priority queue with distance(priority) 0.
+        Each pop is skipped if a shorter distance was already settled (stale entry),
+        and a neighbor is only pushed when the relaxed distance strictly improves
+        on its best known one, so the heap never fills up with useless entries.
+        """
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+
+        # Bound locally to skip the module attribute lookup on every queue op
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        dist = [float('inf')] * self.v_count
+        dist[src] = 0
+
+        pq = [(0, src)]  # heap of (distance, vertex)
+        while pq:
+            distance, vertex = heappop(pq)
+
+            # Stale entry, this vertex was already settled with a shorter distance
+            if distance > dist[vertex]:
+                continue
+
+            # Walk this vertex's CSR slice of stored edges; zipping the two
+            # slices keeps the pairing in C instead of indexing per edge
+            start, end = indptr[vertex], indptr[vertex + 1]
+            for adj, weight in zip(indices[start:end], weights[start:end]):
+                relaxed = distance + weight
+
+                # Only push when the new distance strictly improves
+                if relaxed < dist[adj]:
+                    dist[adj] = relaxed
+                    heappush(pq, (relaxed, adj))
+
+        return dist
+
+    def _dijkstra_buckets(self, src: int) -> []:
+        """
+        Dial's algorithm: Dijkstra with a monotone bucket queue.
+
+        Tentative distances only ever fall inside a window of max_weight
+        above the distance currently being settled, so max_weight + 1
+        cyclic buckets (deques keyed by distance modulo the bucket count)
+        can hold every pending vertex. Draining buckets in distance order
+        replaces every O(log N) heap operation with an O(1) append/popleft;
+        stale entries are skipped by comparing against the distance list.
+        """
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+
+        size = self._max_weight + 1
+        buckets = [deque() for _ in range(size)]
+
+        dist = [float('inf')] * self.v_count
+        dist[src] = 0
+
+        buckets[0].append(src)
+        pending = 1
+        current = 0  # distance value being settled
+        while pending:
+            bucket = buckets[current % size]
+            while bucket:
+                vertex = bucket.popleft()
+                pending -= 1
+
+                # Stale entry, this vertex was settled with a shorter distance
+                if dist[vertex] != current:
+                    continue
+
+                start, end = indptr[vertex], indptr[vertex + 1]
+                for adj, weight in zip(indices[start:end], weights[start:end]):
+                    relaxed = current + weight
+
+                    # Only queue when the new distance strictly improves
+                    if relaxed < dist[adj]:
+                        dist[adj] = relaxed
+                        buckets[relaxed % size].append(adj)
+                        pending += 1
+            current += 1
+
+        return dist
 
 if __name__ == '__main__':
 
@@ -1,44 +1,62 @@
 # Author: Nicholas Bowden
-# Description: A modified version of Dijkstra's algorithm to find a valid path through a maze. 
+# Description: A breadth-first search to find a valid path through a maze.
 # The maze input should consist of a nested list where open spaces are empty and walls are represented with '#'
 
-import heapq
+from array import array
+from collections import deque
 
 def solve_puzzle(board, source, destination):
-    if source == destination: return [source] 
+    if source == destination: return [source]
 
     max_x = len(board)
     max_y = len(board[0])
 
-    shortest_path = None
-    distances = {(r,c): float('inf') for r in range(max_x) for c in range(max_y)}
-    distances[source] = 0
+    # Flat distance array indexed by x*max_y + y; no cell can be further than
+    # the cell count, so that works as the "infinity" starting value
+    unreached = max_x * max_y + 1
+    distances = array('i', [unreached] * (max_x * max_y))
+    distances[source[0] * max_y + source[1]] = 0
 
-    # Format: Distance from source, source node, current path
-    priority_queue = [(0, source,[source])]
+    # Cheapest known predecessor of each reached cell, for path reconstruction
+    parent = {source: None}
 
-    while len(priority_queue) > 0:
-        current_distance, (x,y), path = heapq.heappop(priority_queue)
+    # Every move costs exactly 1, so Dijkstra's priority queue degenerates to
+    # a plain FIFO: cells leave the queue in nondecreasing distance order
+    queue = deque([source])
+
+    while len(queue) > 0:
+        x, y = queue.popleft()
+
+        # Cells leave the queue in nondecreasing distance order, so the rest
+        # of the frontier can't improve on the destination once it's out
+        if (x, y) == destination:
+            break
+
+        current_distance = distances[x * max_y + y]
 
-        # Only process each node once, the first time it is removed from the priority queue
-        if current_distance > distances[(x,y)]:
-            continue
-        
         for x_change, y_change in [(0,1), (1,0), (-1,0), (0,-1)]: # Potential moves: Up, right, down, left
             nx = x + x_change
             ny = y + y_change
             if not 0 <= nx <max_x or not 0<=ny<max_y: continue # Checks for invalid neighbor
             if board[nx][ny] == '#': continue # Checks for wall cell
-            
-            distance = current_distance + 1
-
-            # If we found a new minimum value for a path then we will update the dict and explore that path
-            if distance < distances[(nx,ny)]:
-                distances[(nx,ny)] = distance
-                heapq.heappush(priority_queue, (distance, (nx,ny), path + [(nx,ny)]))
 
-                # Neighbor is destination and path is shorter, update shortest_path
-                if (nx,ny) == destination: 
-                    shortest_path = path+[destination] 
+            distance = current_distance + 1
 
-    return shortest_path  
+            # First time this cell is reached is also the shortest way to it
+            if distance < distances[nx * max_y + ny]:
+                distances[nx * max_y + ny] = distance
+                parent[(nx,ny)] = (x,y)
+                queue.append((nx,ny))
+
+    # Destination never reached
+    if destination not in parent:
+        return None
+
+    # Walk the parent chain back from the destination and flip it
+    path = []
+    cell = destination
+    while cell is not None:
+        path.append(cell)
+        cell = parent[cell]
+    path.reverse()
+    return path
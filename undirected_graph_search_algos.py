@@ -1,8 +1,9 @@
 # Author: Nicholas Bowden
-# Description: Undirected graph methods implemented: add_vertex(), add_edge()remove_edge(), 
+# Description: Undirected graph methods implemented: add_vertex(), add_edge()remove_edge(),
 #   remove_vertex()get_vertices(), get_edges()is_valid_path(), dfs(), ​bfs()count_connected_components(), has_cycle()
 
-from collections import deque
+from array import array
+import sys
 
 class UndirectedGraph:
     """
@@ -15,20 +16,60 @@ class UndirectedGraph:
 
     def __init__(self, start_edges=None):
         """
-        Store graph info as adjacency list
-        """
-        self.adj_list = dict()
+        Store graph info as adjacency sets over internal integer ids.
 
-        # populate graph with initial vertices and edges (if provided)
+        Vertex names stay strings at the API, but each name is assigned an
+        integer id on first sight (id_of maps name -> id, names maps id ->
+        name) and the adjacency sets hold ids. Hot loops then index arrays
+        instead of hashing strings. Removed vertices leave a None tombstone
+        in names; ids are never reused.
+        """
+        self.id_of = dict()  # vertex name -> internal id
+        self.names = []      # internal id -> vertex name (None when removed)
+        self.adj = []        # internal id -> set of neighbor ids
+        self._sorted_adj = dict()  # id -> name-sorted neighbor ids, dropped on mutation
+
+        # Persistent disjoint-set state for the connectivity queries.
+        # add_vertex/add_edge update it in place; removals reset parent to
+        # None (an edge deletion can split a component, which a DSU cannot
+        # undo), forcing a rebuild on the next query.
+        self._dsu_parent = None  # id -> parent id, None when stale
+        self._dsu_rank = None
+        self._edges = 0
+        self._components = 0
+
+        # populate graph with initial vertices and edges (if provided).
+        # The graph is empty here, so the per-edge method overhead
+        # (cache and DSU upkeep, known-vertex rechecks) buys nothing;
+        # assign ids and fill the adjacency sets directly in one pass
         if start_edges is not None:
+            id_of = self.id_of
+            names = self.names
+            adj = self.adj
             for u, v in start_edges:
-                self.add_edge(u, v)
+                if u == v:  # same vertex passed
+                    continue
+                u_id = id_of.get(u)
+                if u_id is None:
+                    u = sys.intern(u)
+                    u_id = id_of[u] = len(names)
+                    names.append(u)
+                    adj.append(set())
+                v_id = id_of.get(v)
+                if v_id is None:
+                    v = sys.intern(v)
+                    v_id = id_of[v] = len(names)
+                    names.append(v)
+                    adj.append(set())
+                adj[u_id].add(v_id)
+                adj[v_id].add(u_id)
 
     def __str__(self):
         """
         Return content of the graph in human-readable form
         """
-        out = [f'{v}: {self.adj_list[v]}' for v in self.adj_list]
+        out = [f'{name}: {sorted(self.names[a] for a in self.adj[i])}'
+               for i, name in enumerate(self.names) if name is not None]
         out = '\n  '.join(out)
         if len(out) < 70:
             out = out.replace('\n  ', ', ')
@@ -37,293 +78,475 @@ class UndirectedGraph:
 
     # ------------------------------------------------------------------ #
 
+    def _neighbors_sorted(self, v_id: int) -> []:
+        """
+        Return v_id's neighbor ids in vertex-name order, cached per vertex.
+
+        The cache entry is dropped whenever an edge touching the vertex
+        changes, so repeated traversals between mutations sort each
+        neighborhood at most once. Callers must not mutate the result.
+        """
+        cached = self._sorted_adj.get(v_id)
+        if cached is None:
+            cached = sorted(self.adj[v_id], key=self.names.__getitem__)
+            self._sorted_adj[v_id] = cached
+        return cached
+
     def add_vertex(self, v: str) -> None:
         """
-        Add new vertex to the graph. 
-        
-        Does nothing if the vertex passed is already in the dictionary. 
-        Initializes an empty list to store adjacent vertices.
+        Add new vertex to the graph.
+
+        Does nothing if the vertex passed is already known.
+        Assigns the next integer id and initializes an empty adjacency set.
+        The name is interned so later id_of lookups with an equal string
+        short-circuit on pointer identity instead of re-hashing.
         """
-        if v in self.adj_list:
+        if v in self.id_of:
             return
-        self.adj_list[v] = []
-        
+        v = sys.intern(v)
+        self.id_of[v] = len(self.names)
+        self.names.append(v)
+        self.adj.append(set())
+
+        # A fresh vertex is its own new component; extend live DSU state
+        if self._dsu_parent is not None:
+            self._dsu_parent.append(len(self.names) - 1)
+            self._dsu_rank.append(0)
+            self._components += 1
+
     def add_edge(self, u: str, v: str) -> None:
         """
-        Add edge to the graph. 
-        
-        If either vertex is not already in the adjacency dictionary, it adds it to the dictionary.
-        Adds each vertex to the others list.
-        Does not allow duplicates to be added on any list.
+        Add edge to the graph.
+
+        If either vertex is not already known, it is added first.
+        Adds each vertex's id to the other's adjacency set; set.add is
+        idempotent, so duplicate edges are ignored without a membership scan.
         Does nothing if that same vertex is passed for both parameters.
         """
         # Same vertex passed
         if u == v:
             return
-        
-        # Adds a new vertex to adj_list if not in the dictionary
-        if u not in self.adj_list:
+
+        # Adds a new vertex if not seen before
+        if u not in self.id_of:
             self.add_vertex(u)
-        if v not in self.adj_list:
+        if v not in self.id_of:
             self.add_vertex(v)
 
-        # Adds opposite vertex to each list if not already present
-        if u not in self.adj_list[v]:
-            self.adj_list[v].append(u)
-        if v not in self.adj_list[u]:
-            self.adj_list[u].append(v)
-        
+        u_id = self.id_of[u]
+        v_id = self.id_of[v]
+
+        # Edge already present: nothing changes and every cache stays valid
+        if v_id in self.adj[u_id]:
+            return
+
+        # Adds opposite vertex to each set
+        self.adj[v_id].add(u_id)
+        self.adj[u_id].add(v_id)
+
+        # Both vertices' sorted neighbor order is stale now
+        self._sorted_adj.pop(u_id, None)
+        self._sorted_adj.pop(v_id, None)
+
+        # Fold the new edge into the live DSU state: union the endpoints,
+        # merging two components unless they were already connected
+        if self._dsu_parent is not None:
+            self._edges += 1
+            root_u, root_v = self._dsu_find(u_id), self._dsu_find(v_id)
+            if root_u != root_v:
+                rank = self._dsu_rank
+                if rank[root_u] < rank[root_v]:
+                    root_u, root_v = root_v, root_u
+                self._dsu_parent[root_v] = root_u
+                if rank[root_u] == rank[root_v]:
+                    rank[root_u] += 1
+                self._components -= 1
+
 
     def remove_edge(self, v: str, u: str) -> None:
         """
-        Remove edge from the graph. 
-        
-        Checks if passed vertices are in the dictionary and then checks if the opposite 
-        vertex is present in each vertices adjacency list and removes each occurrence if found.
+        Remove edge from the graph.
+
+        Looks up both ids and discards each from the other's adjacency set
+        (a no-op when absent).
         Does nothing if the same vertex is passed for both parameters.
         """
         # Same vertex passed
         if u == v:
             return
-        
-        # Checks if passed vertex is in the dictionary
-        if u in self.adj_list:
-            # Removes if found on opposite vertices list
-            if v in self.adj_list[u]:
-                self.adj_list[u].remove(v)
-        
-        # Same for the other vertex
-        if v in self.adj_list:
-            if u in self.adj_list[v]:
-                self.adj_list[v].remove(u)
+
+        u_id = self.id_of.get(u)
+        v_id = self.id_of.get(v)
+
+        # Unknown vertices mean there is no edge to remove
+        if u_id is None or v_id is None:
+            return
+
+        # Absent edge: nothing changes and every cache stays valid
+        if v_id not in self.adj[u_id]:
+            return
+
+        self.adj[u_id].remove(v_id)
+        self.adj[v_id].remove(u_id)
+
+        # Both vertices' sorted neighbor order is stale now
+        self._sorted_adj.pop(u_id, None)
+        self._sorted_adj.pop(v_id, None)
+
+        # Deleting an edge can split a component; the DSU must rebuild
+        self._dsu_parent = None
 
     def remove_vertex(self, v: str) -> None:
         """
-        Remove vertex and all connected edges. 
-        
-        Pops the vertex off the dictionary, uses the list that was popped 
-        to find all the adjacent vertices and remove the occurrence of the removed vertex.
+        Remove vertex and all connected edges.
+
+        Pops the name from the id map, detaches the id from every
+        neighbor's adjacency set, and leaves a tombstone in the name table
+        so the remaining ids stay valid.
         """
-        if v in self.adj_list:
-            edges = self.adj_list.pop(v)
+        v_id = self.id_of.pop(v, None)
+        if v_id is None:
+            return
+
+        for adj_id in self.adj[v_id]:
+            self.adj[adj_id].discard(v_id)
+            self._sorted_adj.pop(adj_id, None)
+
+        self.adj[v_id] = set()
+        self._sorted_adj.pop(v_id, None)
+        self.names[v_id] = None
 
-            for edge in edges:
-                self.adj_list[edge].remove(v)
+        # Dropping a vertex can split components; the DSU must rebuild
+        self._dsu_parent = None
 
     def get_vertices(self) -> []:
         """
         Return list of vertices in the graph (any order).
         """
-        return [*self.adj_list]
+        return [name for name in self.names if name is not None]
 
     def get_edges(self) -> []:
         """
-        Return list of edges in the graph (any order). Appends all the non repeating vertex,edge combonations.
+        Return list of edges in the graph (any order).
+
+        Every edge appears in both endpoints' adjacency sets, so emitting it
+        only from its lexicographically smaller endpoint yields each edge
+        exactly once without scanning the result for duplicates.
         """
+        names = self.names
         result = []
 
-        for vertex in self.adj_list:
-            for edge in self.adj_list[vertex]:
+        for i, name in enumerate(names):
+            if name is None:
+                continue
+            for adj_id in self._neighbors_sorted(i):  # deterministic order
+                adj_name = names[adj_id]
+                if name < adj_name:  # canonical orientation, no loops exist
+                    result.append((name, adj_name))
 
-                if (edge,vertex) not in result:  # prevents 'duplicates' 
-                    result.append((vertex, edge))
-     
         return result
-        
+
 
     def is_valid_path(self, path: []) -> bool:
         """
         Return True if provided path is valid, False otherwise.
 
-        Traverses through each value on the path, checking that the next path value is an adjacent node to the current value.
+        Verifies the first vertex exists, then walks consecutive pairs and
+        returns on the first non-adjacent step. Each vertex is looked up
+        once: the id found while checking a step carries over as the
+        current vertex of the next one.
         """
-        result = True
-        path_size = len(path)
-        
         # Empty path
-        if path_size == 0:
-            return result
+        if not path:
+            return True
 
-        # Single value, verifies that it's valid
-        if path_size == 1:
-            if path[0] not in self.adj_list:
-                result = False
+        id_of = self.id_of
 
-        # Traverses through verifying that each step and the next are possible
-        for i in range(path_size-1):
-            if path[i] not in self.adj_list:  # Current node not in list
+        cur_id = id_of.get(path[0])
+        if cur_id is None:  # First node not in the graph
+            return False
+
+        for next_name in path[1:]:
+            next_id = id_of.get(next_name)
+            if next_id is None or next_id not in self.adj[cur_id]:  # Next node not adjacent to current node
                 return False
-            if path[i+1] not in self.adj_list[path[i]]:  # Next node not adjacent to current node
-                result = False
+            cur_id = next_id
 
-        return result
+        return True
 
 
     def dfs(self, v_start, v_end=None) -> []:
         """
-        Return list of vertices visited during this recursive DFS search. 
-        
+        Return list of vertices visited during this DFS search.
+
         Vertices are picked in alphabetical order.
         Can be used to find a specific node by using v_end, or find all connected nodes without.
 
-        Starts at the passed node and saves it as visited, then takes the adjacency list and sorts.
-        Iterating through that list, if v_end is found then it is added to visited and the 
-        function stops. If v_end is not found or not present, the function continues looking for adjacent
-        nodes that have not been visited yet. Once it has visited them all it returns the result.
+        Runs an explicit stack of neighbor iterators instead of recursion:
+        the top iterator is advanced to its next unseen neighbor, that
+        neighbor is visited and its own (name-sorted) iterator pushed; when
+        an iterator is exhausted the stack pops back to the previous vertex.
+        Seen flags live in a bytearray indexed by internal id, translating
+        back to names only when recording the visit order. Neighbor sort
+        order comes from the per-vertex cache, so repeated traversals
+        between mutations skip the sorting entirely.
+        Stops as soon as v_end is visited, if one was given.
+
+        The walk-everything and search-for-a-target cases run in separate
+        loops, picked once up front, so the common full walk carries no
+        per-visit target comparison.
         """
-        visited = []
+        start = self.id_of.get(v_start)
 
         # Invalid start
-        if v_start not in self.get_vertices():
-            return visited
-
-        def rec_dfs(visited, v, v_end=None):
-            """Recursive depth first search"""
-            if v_end:
-                if v_end not in visited: # Runs until v_end is visited
-                    visited.append(v) 
-            elif v_end is None:  # Runs until all adjacent nodes are visited
-                visited.append(v)
-    
-            # Test cases require ascending lexicographical order
-            self.adj_list[v].sort()
-
-            # Loops through each adjacent vertex, recurring for each
-            for adj in self.adj_list[v]:
-                if v_end and v_end in visited:
+        if start is None:
+            return []
+
+        # Unknown v_end behaves like no target: the whole component is walked
+        end = self.id_of.get(v_end) if v_end is not None else None
+
+        if end is None:
+            return self._dfs_all(start)
+        return self._dfs_search(start, end)
+
+    def _dfs_all(self, start: int) -> []:
+        """Full-component DFS walk from the internal id start"""
+        names = self.names
+        neighbors = self._neighbors_sorted
+
+        seen = bytearray(len(names))
+        seen[start] = 1
+        order = [names[start]]
+
+        stack = [iter(neighbors(start))]
+        while stack:
+            # Advance the top iterator to its next unseen neighbor
+            for adj_id in stack[-1]:
+                if not seen[adj_id]:
+                    seen[adj_id] = 1
+                    order.append(names[adj_id])
+                    stack.append(iter(neighbors(adj_id)))
+                    break
+            else:  # Iterator exhausted, back up one vertex
+                stack.pop()
+
+        return order
+
+    def _dfs_search(self, start: int, end: int) -> []:
+        """DFS from the internal id start, stopping once end is visited"""
+        names = self.names
+        neighbors = self._neighbors_sorted
+
+        seen = bytearray(len(names))
+        seen[start] = 1
+        order = [names[start]]
+        if start == end:
+            return order
+
+        stack = [iter(neighbors(start))]
+        while stack:
+            for adj_id in stack[-1]:
+                if not seen[adj_id]:
+                    seen[adj_id] = 1
+                    order.append(names[adj_id])
+                    if adj_id == end:
+                        return order
+                    stack.append(iter(neighbors(adj_id)))
                     break
-                elif adj not in visited:
-                    rec_dfs(visited, adj, v_end)
-                
-        rec_dfs(visited, v_start, v_end)
-      
-        return visited
+            else:
+                stack.pop()
+
+        return order
 
     def bfs(self, v_start, v_end=None) -> []:
         """
-        Return list of vertices visited during BFS search. 
+        Return list of vertices visited during BFS search.
 
-        Uses a queue to keep track of unvisited vertices, runs until the queue is empty, indicating 
-        every connected node has been visited. 
+        Uses a queue to keep track of unvisited vertices, runs until the queue is empty, indicating
+        every connected node has been visited.
         Can be used to search from node to node with the presence of v_end or to find all connected nodes without.
 
-        Takes the vertex at the front of the queue and gets it's adjacent vertex list. This method then
-        adds the vertex to the result list if its not a duplicate.
-        Sorts the edges in alphabetical order, adds each vertex to the queue if it's not a duplicate.
-        Ends when v_end is added to the result list or when the queue is empty indicating that all of the connected
-        nodes have been visited.
+        Seen flags live in a bytearray indexed by internal id, so each
+        membership test is O(1); the visit order is kept in a separate list
+        of names. The queue is a preallocated array('i') walked with
+        head/tail indices: vertices are marked seen as they are enqueued,
+        so each one enters at most once, the buffer can never overflow, and
+        no per-node allocation happens during the traversal.
         """
-        visited = []
-        
+        start = self.id_of.get(v_start)
+
         # Invalid starting node
-        if v_start not in self.adj_list:
-            return visited
+        if start is None:
+            return []
 
-        next_vertex = deque()  # imported structure
-        next_vertex.append(v_start) 
+        names = self.names
+        neighbors = self._neighbors_sorted
 
-        # Runs until v_end is found or queue is empty
-        while len(next_vertex) != 0:
-            vertex = next_vertex.popleft()  # dequeue 
-            edges = self.adj_list[vertex]
+        end = self.id_of.get(v_end) if v_end is not None else None
+
+        seen = bytearray(len(names))
+        order = []
 
-            # Marks as visitied
-            if vertex not in visited:  
-                visited.append(vertex)
+        queue = array('i', [0]) * len(names)
+        head = tail = 0
+        queue[tail] = start
+        tail += 1
+        seen[start] = 1
+
+        # Live vertices not yet discovered; once this hits zero the biggest
+        # frontier's edge scans can't find anything and are skipped outright
+        unseen = len(self.id_of) - 1
+
+        # Runs until v_end is found or queue is empty
+        while head < tail:
+            vertex = queue[head]  # dequeue
+            head += 1
+            order.append(names[vertex])
 
             # Ends loop
-            if vertex == v_end:  
-                return visited 
+            if vertex == end:
+                return order
 
-            edges.sort()  # Alphabetical order
-            for item in edges:
-                if item not in visited:
-                    next_vertex.append(item)  # enqueue if not duplicate
-            
-        return visited        
+            if unseen:
+                for adj_id in neighbors(vertex):  # Alphabetical order
+                    if not seen[adj_id]:
+                        seen[adj_id] = 1
+                        unseen -= 1
+                        queue[tail] = adj_id  # enqueue exactly once
+                        tail += 1
 
-    def count_connected_components(self):
-        """
-        Return the number of connected componets in the graph.
+        return order
 
-        Gets a list of current vertices. Starts with the first vertex in the list and runs a dfs on it.
-        The connected vertices are returned from that method then each of those connections are removed from
-        the vertices list, leaving any unconnected nodes in the list. Increments the count for each removal of 
-        an empty node or connected set found through dfs.
-        """
-        count = 0
-        vertices = self.get_vertices()
-      
-        # Runs until vertices is empty
-        while len(vertices) > 0:
-            vertex = vertices[0]
-            
-            # Empty list, increment count
-            if len(self.adj_list[vertex]) == 0:
-                count += 1
-                vertices.remove(vertex)
+    def bfs_multi(self, sources) -> dict:
+        """
+        Run BFS from several start vertices in one shared sweep.
+
+        Returns a dict mapping each valid source name to the list of
+        vertices reachable from it, in breadth-first level order with
+        alphabetical order inside each level. Unknown and duplicate
+        sources are skipped.
+
+        Rather than one traversal per source, every vertex carries an
+        int bitmask with one bit per source. Each level, a frontier
+        vertex offers its newly gained bits to its neighbors, masked by
+        the bits they have already seen, so all the searches share a
+        single pass over the edges per level instead of rescanning the
+        graph once per source.
+        """
+        names = self.names
+        neighbors = self._neighbors_sorted
+
+        # Bits each vertex has been reached by so far, indexed by id
+        visited = [0] * len(names)
+        bit_source = []  # bit position -> source name
+        order = {}
+
+        # Level 0: every source is reached by (only) itself
+        frontier = {}  # vertex id -> bits gained this level
+        for name in sources:
+            v_id = self.id_of.get(name)
+            if v_id is None or name in order:
                 continue
+            bit = 1 << len(bit_source)
+            bit_source.append(name)
+            order[name] = [name]
+            visited[v_id] = bit
+            frontier[v_id] = bit
+
+        while frontier:
+            # Collect what the next level gains; visited only moves once
+            # the whole level is done, keeping every search in step
+            advance = {}
+            for vertex, mask in frontier.items():
+                for adj_id in neighbors(vertex):
+                    gain = mask & ~visited[adj_id]
+                    if gain:
+                        advance[adj_id] = advance.get(adj_id, 0) | gain
+
+            for adj_id in sorted(advance, key=names.__getitem__):
+                gain = advance[adj_id]
+                visited[adj_id] |= gain
+                adj_name = names[adj_id]
+                while gain:  # one append per newly arrived search
+                    low_bit = gain & -gain
+                    order[bit_source[low_bit.bit_length() - 1]].append(adj_name)
+                    gain ^= low_bit
+
+            frontier = advance
+
+        return order
+
+    def _dsu_find(self, x: int) -> int:
+        """
+        Root of x's component in the live DSU, halving the path on the way up.
+        """
+        parent = self._dsu_parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
-            # Remove nodes returned from dfs, increment count
-            connection = self.dfs(vertex)
-            for component in connection:
-                vertices.remove(component)
-            count += 1
+    def _component_scan(self):
+        """
+        Return (vertices, edges, components) for the live graph.
 
-        return count
+        The disjoint-set state persists across queries: add_vertex and
+        add_edge fold their changes in incrementally, so on add-heavy
+        workloads repeated connectivity queries cost O(1) here. Only after
+        a removal does this rebuild with a full union-find sweep
+        (path-halving find, union by rank) over the internal ids.
+        """
+        if self._dsu_parent is None:
+            size = len(self.names)
+            parent = self._dsu_parent = list(range(size))
+            rank = self._dsu_rank = bytearray(size)
+            find = self._dsu_find
+
+            edges = 0
+            components = len(self.id_of)
+
+            for vertex, name in enumerate(self.names):
+                if name is None:
+                    continue
+                for adj_id in self.adj[vertex]:
+                    if adj_id < vertex:  # each edge counts once
+                        continue
+                    edges += 1
+                    root_v, root_a = find(vertex), find(adj_id)
+                    if root_v == root_a:
+                        continue
+                    # Union by rank, components merge
+                    if rank[root_v] < rank[root_a]:
+                        root_v, root_a = root_a, root_v
+                    parent[root_a] = root_v
+                    if rank[root_v] == rank[root_a]:
+                        rank[root_v] += 1
+                    components -= 1
+
+            self._edges = edges
+            self._components = components
+
+        return len(self.id_of), self._edges, self._components
 
-    def has_cycle(self):
+    def count_connected_components(self):
         """
-        Return True if graph contains a cycle, False otherwise.
+        Return the number of connected componets in the graph.
 
-        Creates a visited dictionary with a initial False value for each vertex.
-        Loops through each one of the vertices, looking for unvisited nodes.
-
-        If a node with an empty list is found, it's skipped over. 
-        If a node has already been visited when encountered, it's skipped.
-
-        Otherwise, using dfs, it recursively checks for cycles by saving
-        the parent of the current node. When adjacent vertices are checked, if a vertex has 
-        already been visited and it is NOT the current parent node, then a cycle has been found.
-        """
-        vertices = self.get_vertices()
-        visited = {vert: False for vert in vertices}
-        cycle = False
-
-        def rec_dfs(visited, parent, v):
-            # Mark current node as visited
-            visited[v] = True
-
-            # Adjacent vertices
-            for adj in self.adj_list[v]:
-        
-                # if adj node hasn't been visited yet
-                if not visited[adj]:
-                    if rec_dfs(visited, v, adj): # Recur to check cycle
-                        return True 
-        
-                # adj node has been visited AND is not the parent
-                elif adj != parent:
-                    return True # Back edge
-        
-            # No back edge
-            return False     
-
-        for vertex in vertices:
-            # Skips empty lists
-            if len(self.adj_list[vertex]) == 0:
-                continue
-            
-            # Skips visited nodes, looking for unvisited chains
-            if visited[vertex]:
-                continue
+        Near-linear O(E * alpha(V)) union-find pass; see _component_scan.
+        """
+        return self._component_scan()[2]
 
-            # Returns True if cycle is found, continues otherwise
-            if rec_dfs(visited, None, vertex):
-                cycle = True
-                break 
+    def has_cycle(self):
+        """
+        Return True if graph contains a cycle, False otherwise.
 
-        return cycle    
+        A forest with C components spans exactly V - C edges, so any graph
+        carrying more than that must close a cycle. One shared union-find
+        pass supplies all three counts - no DFS, no recursion, no parent
+        tracking.
+        """
+        vertices, edges, components = self._component_scan()
+        return edges > vertices - components
 
 if __name__ == '__main__':
 